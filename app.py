@@ -1,106 +1,373 @@
-import json
+import atexit
+import click
+import logging
+import orjson
 import os
+import psycopg
+import queue
 import re
+import reprlib
+import threading
+import time
 import requests
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from dateutil import parser as date_parser
-from flask import Flask, request, jsonify
-from psycopg import connect
-from psycopg.rows import dict_row
+from flask import Flask, Response, current_app, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from logging.handlers import QueueHandler, QueueListener
+from psycopg.rows import dict_row, tuple_row
+from psycopg.types.json import set_json_dumps, set_json_loads
+from psycopg_pool import ConnectionPool
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Log records are handed to a queue and written to stderr by a listener thread,
+# so request threads never block on log I/O. Only this module's logger is
+# configured; the root logger is left to whatever process hosts the app.
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+if LOG_LEVEL not in logging.getLevelNamesMapping():
+    LOG_LEVEL = "INFO"
+
+logger = logging.getLogger(__name__)
+if not any(isinstance(h, QueueHandler) for h in logger.handlers):
+    _log_queue = queue.Queue()
+    _log_stream_handler = logging.StreamHandler()
+    _log_stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+    )
+    _log_listener = QueueListener(_log_queue, _log_stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    logger.addHandler(QueueHandler(_log_queue))
+    logger.setLevel(LOG_LEVEL)
+    logger.propagate = False
+
+# Size-bounded repr for debug previews of payloads, so a preview never walks or
+# copies the whole payload the way serializing it and slicing would
+_payload_repr = reprlib.Repr()
+_payload_repr.maxlevel = 4
+_payload_repr.maxdict = 10
+_payload_repr.maxlist = 10
+_payload_repr.maxstring = 200
+_payload_repr.maxother = 200
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for request parsing and jsonify responses"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Build the body straight from orjson's bytes rather than dumps() -> str -> bytes.
+        # Arguments follow jsonify: one positional value, several (a list), or keywords
+        if args and kwargs:
+            raise TypeError("response() takes either positional or keyword arguments, not both")
+        obj = args[0] if len(args) == 1 else (args or kwargs or None)
+        return current_app.response_class(orjson.dumps(obj, default=self.default, option=orjson.OPT_APPEND_NEWLINE), mimetype=self.mimetype)
+
 
 # Webhook receiver for Krisp to Notion integration
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+
+def get_database_url():
+    """Get DATABASE_PUBLIC_URL (external) or DATABASE_URL (internal)"""
+    # Prefer DATABASE_PUBLIC_URL for Railway external connections
+    return os.environ.get("DATABASE_PUBLIC_URL") or os.environ.get("DATABASE_URL")
+
+
+# Decode JSONB columns (payload_data on older rows) and encode any Json/Jsonb
+# parameters with orjson rather than the stdlib json module
+set_json_loads(orjson.loads)
+set_json_dumps(orjson.dumps)
+
+# Connection pool shared by every request, so the TCP+TLS+auth handshake is paid
+# once per pooled connection rather than once per request. prepare_threshold=0
+# prepares every statement on first use, so repeat queries on a pooled connection
+# skip the server-side parse/plan step. The pool is per worker process and
+# DB_POOL_MAX_SIZE caps how many of the worker's requests use the database at once
+_db_url = get_database_url()
+if not _db_url:
+    logger.warning("No database URL found in environment variables")
+POOL = ConnectionPool(
+    _db_url,
+    kwargs={"row_factory": dict_row, "prepare_threshold": 0},
+    min_size=int(os.environ.get("DB_POOL_MIN_SIZE", 2)),
+    max_size=int(os.environ.get("DB_POOL_MAX_SIZE", 10)),
+    max_idle=300,
+    open=False
+) if _db_url else None
+
 
 # Database connection function
 def get_db_connection():
-    """Get database connection using DATABASE_PUBLIC_URL (external) or DATABASE_URL (internal)"""
-    # Prefer DATABASE_PUBLIC_URL for Railway external connections
-    db_url = os.environ.get("DATABASE_PUBLIC_URL") or os.environ.get("DATABASE_URL")
-    
-    if not db_url:
+    """Borrow a connection from the pool (returned to the pool when the with-block exits)"""
+    if POOL is None:
         raise Exception("No database URL found in environment variables")
     
-    return connect(db_url)
+    return POOL.connection()
+
+
+# Whole schema setup as one idempotent script, so it costs a single round-trip
+SCHEMA_SQL = """
+    -- Only one process runs the DDL at a time (arbitrary lock key); the lock is
+    -- released when the transaction commits
+    SELECT pg_advisory_xact_lock(827134);
+    
+    -- Create payloads table if it doesn't exist
+    CREATE TABLE IF NOT EXISTS payloads (
+        id SERIAL PRIMARY KEY,
+        received_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        payload_data JSONB
+    );
+    
+    -- New payloads are stored as orjson bytes so the write path skips JSONB parsing;
+    -- payload_data stays populated for rows written before payload_blob existed
+    ALTER TABLE payloads ADD COLUMN IF NOT EXISTS payload_blob BYTEA;
+    ALTER TABLE payloads ALTER COLUMN payload_data DROP NOT NULL;
+    
+    -- Vacuum more eagerly so the visibility map stays current for index-only scans
+    -- on idx_payloads_received_at_id (built by PAYLOADS_INDEX_SQL below)
+    ALTER TABLE payloads SET (autovacuum_vacuum_scale_factor = 0.02);
+    
+    -- Create sent_tasks table to track tasks sent to Zapier
+    CREATE TABLE IF NOT EXISTS sent_tasks (
+        id SERIAL PRIMARY KEY,
+        payload_id INTEGER REFERENCES payloads(id),
+        task TEXT NOT NULL,
+        owner VARCHAR(255) NOT NULL,
+        sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        zapier_response TEXT,
+        success BOOLEAN NOT NULL
+    );
+    ALTER TABLE sent_tasks ADD COLUMN IF NOT EXISTS meeting_name VARCHAR(255);
+    ALTER TABLE sent_tasks ADD COLUMN IF NOT EXISTS meeting_date VARCHAR(255);
+    
+    -- Create indexes for sent_tasks; (sent_at, id) serves keyset pagination
+    -- (replaces idx_sent_tasks_sent_at)
+    CREATE INDEX IF NOT EXISTS idx_sent_tasks_sent_at_id
+    ON sent_tasks(sent_at DESC, id DESC);
+    DROP INDEX IF EXISTS idx_sent_tasks_sent_at;
+    CREATE INDEX IF NOT EXISTS idx_sent_tasks_payload_id
+    ON sent_tasks(payload_id);
+"""
+
+
+# Index on (received_at, id) so /latest and /summary, which order by both, are
+# answered with index-only scans (replaces idx_payloads_received_at and
+# idx_payloads_received_at_incl). CONCURRENTLY can't run inside a transaction
+# block, so these run one at a time in autocommit mode after SCHEMA_SQL, and
+# never block writes to payloads while the index builds
+PAYLOADS_INDEX_SQL = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_payloads_received_at_id ON payloads(received_at DESC, id DESC)",
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_payloads_received_at_incl",
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_payloads_received_at",
+)
+
+
+def _build_payloads_indexes():
+    """Build PAYLOADS_INDEX_SQL on a dedicated autocommit connection (not a pooled one)"""
+    with psycopg.connect(_db_url, autocommit=True) as conn:
+        # Same key as SCHEMA_SQL, but only tried: a process waiting on the lock would
+        # hold a snapshot that the concurrent build has to wait out
+        if not conn.execute("SELECT pg_try_advisory_lock(827134)").fetchone()[0]:
+            logger.info("Another process is building the payloads indexes, skipping")
+            return
+        
+        try:
+            # A build that failed part way leaves an invalid index that IF NOT EXISTS
+            # would keep, so drop it and start over
+            invalid = conn.execute("""
+                SELECT NOT indisvalid
+                FROM pg_index
+                WHERE indexrelid = to_regclass('idx_payloads_received_at_id')
+            """).fetchone()
+            if invalid and invalid[0]:
+                conn.execute("DROP INDEX CONCURRENTLY idx_payloads_received_at_id")
+            
+            for statement in PAYLOADS_INDEX_SQL:
+                conn.execute(statement)
+        finally:
+            conn.execute("SELECT pg_advisory_unlock(827134)")
 
 
 def init_db():
-    """Initialize database tables if they don't exist"""
+    """Initialize database tables if they don't exist; raises if the schema can't be applied"""
+    with get_db_connection() as conn:
+        # No parameters, so psycopg sends the whole script in one simple query
+        conn.execute(SCHEMA_SQL, prepare=False)
+        conn.commit()
+    _build_payloads_indexes()
+    logger.info("Database initialized successfully")
+
+
+@app.cli.command("init-db")
+def init_db_command():
+    """Create or migrate the database schema (run once per deploy, before starting workers)"""
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cursor:
-                # Create payloads table if it doesn't exist
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS payloads (
-                        id SERIAL PRIMARY KEY,
-                        received_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        payload_data JSONB NOT NULL
-                    )
-                """)
-                
-                # Create index on received_at for faster queries
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_payloads_received_at 
-                    ON payloads(received_at DESC)
-                """)
-                
-                # Create sent_tasks table to track tasks sent to Zapier
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS sent_tasks (
-                        id SERIAL PRIMARY KEY,
-                        payload_id INTEGER REFERENCES payloads(id),
-                        task TEXT NOT NULL,
-                        owner VARCHAR(255) NOT NULL,
-                        sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        zapier_response TEXT,
-                        success BOOLEAN NOT NULL
-                    )
-                """)
-                
-                # Create indexes for sent_tasks
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_sent_tasks_sent_at 
-                    ON sent_tasks(sent_at DESC)
-                """)
-                
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_sent_tasks_payload_id 
-                    ON sent_tasks(payload_id)
-                """)
-                
-                # Add meeting_name and meeting_date columns if they don't exist
-                # Check if columns exist before adding them
-                cursor.execute("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_name='sent_tasks' AND column_name='meeting_name'
-                """)
-                if not cursor.fetchone():
-                    cursor.execute("""
-                        ALTER TABLE sent_tasks 
-                        ADD COLUMN meeting_name VARCHAR(255)
-                    """)
-                
-                cursor.execute("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_name='sent_tasks' AND column_name='meeting_date'
-                """)
-                if not cursor.fetchone():
-                    cursor.execute("""
-                        ALTER TABLE sent_tasks 
-                        ADD COLUMN meeting_date VARCHAR(255)
-                    """)
-                
-                conn.commit()
-        print("Database initialized successfully")
+        init_db()
     except Exception as e:
-        print(f"Error initializing database: {str(e)}")
-        # Don't fail startup - connection might be temporary
-        pass
+        # Exit non-zero so a deploy chained with && stops before starting workers
+        raise click.ClickException(f"Error initializing database: {e}")
+
+
+# Open the pool on startup (schema setup runs separately via `flask init-db`)
+if POOL is not None:
+    POOL.open()
+    atexit.register(POOL.close)
+
+
+def load_payload(row):
+    """Decode a payloads row's body from payload_blob, or payload_data for older rows"""
+    if row["payload_blob"] is not None:
+        return orjson.loads(row["payload_blob"])
+    return row["payload_data"]
+
+
+# Payloads are written by a single background thread so that bursts of webhook
+# requests share one connection and one COPY round-trip instead of one INSERT each
+PAYLOAD_BATCH_SIZE = 100
+PAYLOAD_WRITE_TIMEOUT = 30
+
+_payload_queue = queue.Queue()
+
+
+def _flush_payloads(bodies):
+    """
+    Write a batch of serialized JSON payload bodies to the payloads table using COPY FROM STDIN.
+    COPY can't return generated values, so ids are reserved from the sequence first.
+    received_at isn't read back per row: every row in the batch gets the transaction
+    timestamp from the column default, so it is fetched once with the reservation.
+    Returns list of (id, received_at) tuples in the same order as bodies.
+    """
+    with get_db_connection() as conn:
+        with conn.cursor() as cursor:
+            # One result row: the shared timestamp plus an array of reserved ids
+            cursor.execute("""
+                SELECT LOCALTIMESTAMP AS received_at,
+                       array_agg(nextval(pg_get_serial_sequence('payloads', 'id'))) AS ids
+                FROM generate_series(1, %s)
+            """, (len(bodies),), prepare=True)
+            reservation = cursor.fetchone()
+            
+            with cursor.copy("COPY payloads (id, payload_blob) FROM STDIN") as copy:
+                for payload_id, body in zip(reservation["ids"], bodies):
+                    copy.write_row((payload_id, body))
+        
+        conn.commit()
+    
+    return [(payload_id, reservation["received_at"]) for payload_id in reservation["ids"]]
+
+
+def _write_payload_batch(batch):
+    """Write queued (body, future) items, skipping any whose request gave up waiting"""
+    # Claiming each future fails for ones already cancelled by save_payload, so a
+    # request that timed out (and may be retried by the sender) is never written
+    batch = [(body, future) for body, future in batch if future.set_running_or_notify_cancel()]
+    if not batch:
+        return
+    
+    try:
+        reserved = _flush_payloads([body for body, _ in batch])
+    except Exception as e:
+        logger.error("Error writing %d payload(s) to database: %s", len(batch), e)
+        for _, future in batch:
+            future.set_exception(e)
+    else:
+        for (_, future), result in zip(batch, reserved):
+            future.set_result(result)
+
+
+def _payload_writer():
+    """
+    Drain the payload queue until a None sentinel arrives. Each batch is whatever
+    arrived while the previous flush was in progress (up to PAYLOAD_BATCH_SIZE), so a
+    lone request isn't delayed and a burst collapses into a few round-trips.
+    """
+    stopping = False
+    while not stopping:
+        batch = []
+        item = _payload_queue.get()
+        while item is not None:
+            batch.append(item)
+            if len(batch) >= PAYLOAD_BATCH_SIZE:
+                break
+            try:
+                item = _payload_queue.get_nowait()
+            except queue.Empty:
+                break
+        
+        stopping = item is None
+        _write_payload_batch(batch)
+    
+    # Flush anything queued after the sentinel before the thread exits
+    leftover = []
+    while True:
+        try:
+            item = _payload_queue.get_nowait()
+        except queue.Empty:
+            break
+        if item is not None:
+            leftover.append(item)
+    for start in range(0, len(leftover), PAYLOAD_BATCH_SIZE):
+        _write_payload_batch(leftover[start:start + PAYLOAD_BATCH_SIZE])
+
+
+def save_payload(payload, body=None):
+    """
+    Queue a payload for the background writer and wait until it is committed.
+    body is the payload's serialized JSON if the caller already has it (e.g. the raw
+    request body), which is stored as-is instead of re-serializing payload.
+    If the writer hasn't picked the payload up within PAYLOAD_WRITE_TIMEOUT, it is
+    withdrawn and TimeoutError is raised; once a write has started it is awaited,
+    so an error is never reported for a payload that was actually stored.
+    Returns (id, received_at).
+    """
+    if body is None:
+        body = orjson.dumps(payload)
+    
+    future = Future()
+    _payload_queue.put((body, future))
+    try:
+        payload_id, received_at = future.result(timeout=PAYLOAD_WRITE_TIMEOUT)
+    except TimeoutError:
+        if future.cancel():
+            raise
+        payload_id, received_at = future.result()
+    remember_latest(payload_id, received_at, payload)
+    return payload_id, received_at
 
 
-# Initialize database on startup
-init_db()
+def _stop_payload_writer():
+    """Write out payloads still queued at shutdown instead of dropping them"""
+    _payload_queue.put(None)
+    _payload_writer_thread.join(timeout=PAYLOAD_WRITE_TIMEOUT)
+
+
+# Most recent payload seen by this process, so /latest only loads a payload body
+# from the database when a newer one has arrived elsewhere
+_latest = {"id": None, "received_at": None, "payload": None}
+_latest_lock = threading.Lock()
+
+
+def remember_latest(payload_id, received_at, payload):
+    """Cache a payload as the latest one unless a newer payload is already cached"""
+    with _latest_lock:
+        if _latest["id"] is None or (received_at, payload_id) > (_latest["received_at"], _latest["id"]):
+            _latest.update(id=payload_id, received_at=received_at, payload=payload)
+
+
+_payload_writer_thread = threading.Thread(target=_payload_writer, name="payload-writer", daemon=True)
+_payload_writer_thread.start()
+# Registered after POOL.close, so it runs first at exit while the pool is still open
+atexit.register(_stop_payload_writer)
 
 
 def format_date_to_iso8601(date_value):
@@ -124,7 +391,7 @@ def format_date_to_iso8601(date_value):
             return parsed_date.strftime('%Y-%m-%dT%H:%M:%SZ')
         except (ValueError, TypeError):
             # If parsing fails, return None
-            print(f"Warning: Could not parse date value: {date_value}")
+            logger.warning("Could not parse date value: %s", date_value)
             return None
     
     # If it's a number (timestamp), try to convert
@@ -133,110 +400,159 @@ def format_date_to_iso8601(date_value):
             parsed_date = datetime.fromtimestamp(date_value)
             return parsed_date.strftime('%Y-%m-%dT%H:%M:%SZ')
         except (ValueError, OSError):
-            print(f"Warning: Could not parse timestamp: {date_value}")
+            logger.warning("Could not parse timestamp: %s", date_value)
             return None
     
     return None
 
 
-def parse_tasks_from_payload(payload):
-    """
-    Parse tasks from payload. Handles multiple formats:
-    - Markdown task list: "- [ ] Owner to task description"
-    - Task/Owner format: "Task: ... Owner: ..."
-    Returns list of dicts with 'task' and 'owner' keys.
-    """
-    tasks = []
-    
-    # If payload is a string, try to parse it as JSON first
-    if isinstance(payload, str):
-        try:
-            payload = json.loads(payload)
-        except json.JSONDecodeError:
-            # If not JSON, treat as plain text
-            pass
-    
+# Markdown task list item: "- [ ]" followed by owner name, "to", and task description.
+# Stops at next task item or end of string
+MARKDOWN_TASK_RE = re.compile(r'-\s*\[\s*\]\s+(\w+)\s+to\s+(.+?)(?=\n\s*-\s*\[|$)', re.MULTILINE | re.DOTALL | re.IGNORECASE)
+
+# "Task: ... Owner: ..." format. The task must start and end on a non-space character
+# (the lazy ?? keeps one-character tasks shortest-first), so whitespace runs can't be
+# split between \s* / \s+ and the task group in many ways and \s+ is only tried
+# where a run starts
+TASK_OWNER_RE = re.compile(r'Task:\s*(\S(?:.*?\S)??)\s+Owner:\s*(\w+)', re.DOTALL | re.IGNORECASE)
+
+# Dict payload keys that may hold the task text, in priority order
+PAYLOAD_TEXT_KEYS = ('krisp_blob', 'text', 'content', 'body', 'message', 'data')
+
+# "Task:"/"Owner:" markers bounding where a Task/Owner match may start and end
+TASK_ANCHOR_RE = re.compile(r'Task:', re.IGNORECASE)
+OWNER_ANCHOR_RE = re.compile(r'Owner:', re.IGNORECASE)
+
+# Upper bound on the text scanned for tasks, so an oversized payload can't tie up a worker in the regexes
+MAX_TASK_TEXT_LENGTH = 200_000
+
+# Characters after each "Task:" marker within which its "Owner:" must start
+TASK_MATCH_WINDOW = 2048
+
+# Extra characters past the window for the whitespace and name following "Owner:"
+TASK_OWNER_NAME_SLACK = 256
+
+
+def _extract_task_text(payload):
+    """Pull the text that may contain tasks out of a decoded payload"""
     # Handle list format (e.g., [{'krisp_blob': '...'}])
     if isinstance(payload, list) and len(payload) > 0:
         if isinstance(payload[0], dict) and 'krisp_blob' in payload[0]:
             text_content = payload[0]['krisp_blob']
-            print(f"Found krisp_blob in list payload, length: {len(text_content)}")
+            logger.debug("Found krisp_blob in list payload, length: %d", len(text_content))
         else:
             # Try to extract text from list items
             text_content = '\n'.join(str(item) for item in payload)
-            print(f"Payload is list, converted to text, length: {len(text_content)}")
+            logger.debug("Payload is list, converted to text, length: %d", len(text_content))
     # If payload is a dict, look for common keys that might contain the task text
     elif isinstance(payload, dict):
-        # Check for krisp_blob first, then other common keys
-        text_content = (
-            payload.get('krisp_blob') or
-            payload.get('text') or 
-            payload.get('content') or 
-            payload.get('body') or 
-            payload.get('message') or 
-            payload.get('data') or
-            str(payload)
-        )
-        print(f"Payload is dict, extracted text_content length: {len(str(text_content))}")
+        # Check for krisp_blob first, then other common keys, falling back to the
+        # whole payload as compact JSON. Only non-empty strings count; a nested
+        # object under one of the keys is covered by the fallback instead.
+        for key in PAYLOAD_TEXT_KEYS:
+            text_content = payload.get(key)
+            if isinstance(text_content, str) and text_content:
+                break
+        else:
+            text_content = orjson.dumps(payload).decode()
+        logger.debug("Payload is dict, extracted text_content length: %d", len(text_content))
     else:
         text_content = str(payload)
-        print(f"Payload is not dict/list, text_content length: {len(text_content)}")
+        logger.debug("Payload is not dict/list, text_content length: %d", len(text_content))
     
-    # First, try to parse markdown task list format: "- [ ] Owner to task description"
-    # Pattern matches: "- [ ]" followed by owner name, "to", and task description
-    # Stops at next task item or end of string
-    markdown_pattern = r'-\s*\[\s*\]\s+(\w+)\s+to\s+(.+?)(?=\n\s*-\s*\[|$)'
-    markdown_matches = re.finditer(markdown_pattern, text_content, re.MULTILINE | re.DOTALL | re.IGNORECASE)
+    return text_content
+
+
+def _parse_tasks_from_text(text_content):
+    """
+    Parse tasks from text. Handles multiple formats:
+    - Markdown task list: "- [ ] Owner to task description"
+    - Task/Owner format: "Task: ... Owner: ..."
+    Returns list of dicts with 'task' and 'owner' keys.
+    """
+    tasks = []
     
+    if len(text_content) > MAX_TASK_TEXT_LENGTH:
+        logger.warning("Task text is %d chars, only scanning the first %d", len(text_content), MAX_TASK_TEXT_LENGTH)
+        text_content = text_content[:MAX_TASK_TEXT_LENGTH]
+    
+    # First, try to parse markdown task list format: "- [ ] Owner to task description".
+    # Cheap substring checks skip a regex scan when its literal marker is absent
     match_count = 0
-    for match in markdown_matches:
-        match_count += 1
-        owner = match.group(1).strip()
-        task_text = match.group(2).strip().replace('\n', ' ').strip()  # Remove newlines and extra spaces
-        print(f"Found markdown task {match_count}: owner={owner}, task_length={len(task_text)}")
-        tasks.append({
-            'task': task_text,
-            'owner': owner
-        })
+    if '[' in text_content:
+        for match in MARKDOWN_TASK_RE.finditer(text_content):
+            match_count += 1
+            owner = match.group(1).strip()
+            task_text = match.group(2).strip().replace('\n', ' ').strip()  # Remove newlines and extra spaces
+            logger.debug("Found markdown task %d: owner=%s, task_length=%d", match_count, owner, len(task_text))
+            tasks.append({
+                'task': task_text,
+                'owner': owner
+            })
     
-    # If no markdown tasks found, try the "Task: ... Owner: ..." format
+    # If no markdown tasks found, try the "Task: ... Owner: ..." format. Matching is
+    # anchored at each "Task:" marker and its "Owner:" must start within
+    # TASK_MATCH_WINDOW characters, so the lazy pattern can't backtrack across the whole text
     if match_count == 0:
-        pattern = r'Task:\s*(.+?)\s+Owner:\s*(\w+)'
-        matches = re.finditer(pattern, text_content, re.DOTALL | re.IGNORECASE)
-        
-        for match in matches:
+        pos = 0
+        while True:
+            anchor = TASK_ANCHOR_RE.search(text_content, pos)
+            if anchor is None:
+                break
+            
+            # Jump straight to the markers that have an "Owner:" within reach
+            owner_anchor = OWNER_ANCHOR_RE.search(text_content, anchor.end())
+            if owner_anchor is None:
+                break
+            if owner_anchor.start() - anchor.start() > TASK_MATCH_WINDOW:
+                pos = owner_anchor.start() - TASK_MATCH_WINDOW
+                continue
+            
+            endpos = min(anchor.start() + TASK_MATCH_WINDOW + TASK_OWNER_NAME_SLACK, len(text_content))
+            match = TASK_OWNER_RE.match(text_content, anchor.start(), endpos)
+            # Reject an "Owner:" past the window, or an owner name cut off at endpos
+            if (match is None
+                    or match.end(1) - anchor.start() > TASK_MATCH_WINDOW
+                    or (match.end(2) == endpos and endpos < len(text_content))):
+                pos = anchor.end()
+                continue
+            
+            pos = match.end()
             match_count += 1
             task_text = match.group(1).strip()
             owner = match.group(2).strip()
-            print(f"Found task {match_count}: owner={owner}, task_length={len(task_text)}")
+            logger.debug("Found task %d: owner=%s, task_length=%d", match_count, owner, len(task_text))
             tasks.append({
                 'task': task_text,
                 'owner': owner
             })
     
     if match_count == 0:
-        print(f"No tasks matched pattern. First 500 chars of text_content: {text_content[:500]}")
+        logger.info("No tasks matched pattern. First 500 chars of text_content: %s", text_content[:500])
     
     return tasks
 
 
+def parse_tasks_from_payload(payload):
+    """
+    Parse tasks from a decoded payload (see _parse_tasks_from_text for the formats).
+    Returns list of dicts with 'task' and 'owner' keys.
+    """
+    return _parse_tasks_from_text(_extract_task_text(payload))
+
+
+@lru_cache(maxsize=512)
+def _owner_prefix_pattern(owner):
+    """Compiled pattern matching "Owner to", "Owner:" or "Owner" at the start of a task"""
+    return re.compile(rf'^{re.escape(owner)}(?:\s+to\s+|:\s*|\s+)', re.IGNORECASE)
+
+
 def clean_task_text(task_text, owner):
     """
     Remove owner prefixes like "Anthony to...", "David to..." from task text.
     Capitalizes the first letter of the task.
     """
-    # Pattern to match "Owner to" or "Owner:" at the start
-    patterns = [
-        rf'^{re.escape(owner)}\s+to\s+',
-        rf'^{re.escape(owner)}:\s*',
-        rf'^{re.escape(owner)}\s+',
-    ]
-    
-    cleaned = task_text
-    for pattern in patterns:
-        cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-    
-    cleaned = cleaned.strip()
+    cleaned = _owner_prefix_pattern(owner).sub('', task_text, count=1).strip()
     
     # Capitalize the first letter
     if cleaned:
@@ -245,20 +561,42 @@ def clean_task_text(task_text, owner):
     return cleaned
 
 
+# Zapier webhook URL, resolved once at import
+ZAPIER_WEBHOOK_URL = os.environ.get("ZAPIER_WEBHOOK_URL")
+if not ZAPIER_WEBHOOK_URL:
+    logger.warning("ZAPIER_WEBHOOK_URL not found in environment variables - tasks will not be forwarded")
+
+# Shared HTTP session so Zapier calls reuse keep-alive TCP/TLS connections.
+# Failed connections and 502/503 responses (the hook never ran) are retried with
+# a short backoff; read errors/timeouts and 504 are not, since Zapier may already
+# have received the task and a retry would duplicate it
+ZAPIER_RETRY = Retry(
+    total=2,
+    read=0,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False
+)
+ZAPIER_SESSION = requests.Session()
+ZAPIER_SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=ZAPIER_RETRY))
+
+# Upper bound on concurrent Zapier requests for a single payload
+ZAPIER_MAX_WORKERS = 8
+
+
 def post_to_zapier(task_data):
     """
     Post a single task to Zapier webhook.
     Returns (success: bool, response_text: str)
     """
-    zapier_url = os.environ.get("ZAPIER_WEBHOOK_URL")
-    
-    if not zapier_url:
+    if not ZAPIER_WEBHOOK_URL:
         return False, "ZAPIER_WEBHOOK_URL not found in environment variables"
     
     try:
-        response = requests.post(
-            zapier_url,
-            json=task_data,
+        response = ZAPIER_SESSION.post(
+            ZAPIER_WEBHOOK_URL,
+            data=orjson.dumps(task_data),
             headers={'Content-Type': 'application/json'},
             timeout=10
         )
@@ -268,18 +606,179 @@ def post_to_zapier(task_data):
         return False, str(e)
 
 
+def _extract_meeting(payload):
+    """
+    Find meeting_name and meeting_date anywhere in a (possibly nested) payload.
+    Walks dicts and lists depth-first in document order, so the first occurrence
+    wins, and stops as soon as both are found.
+    Returns (meeting_name, meeting_date), either of which may be None.
+    """
+    meeting_name = None
+    meeting_date = None
+    stack = [payload]
+    while stack and (meeting_name is None or meeting_date is None):
+        item = stack.pop()
+        if isinstance(item, dict):
+            if meeting_name is None:
+                meeting_name = item.get('meeting_name')
+            if meeting_date is None:
+                meeting_date = item.get('meeting_date')
+            children = item.values()
+        elif isinstance(item, list):
+            children = item
+        else:
+            continue
+        # Reversed so the first child is popped (visited) first
+        stack.extend(reversed([child for child in children if isinstance(child, (dict, list))]))
+    
+    return meeting_name, meeting_date
+
+
+def process_payload(payload_id, payload):
+    """
+    Extract meeting details and tasks from a saved payload, forward each task to Zapier
+    and record it in sent_tasks.
+    Returns list of per-task result dicts (empty if no tasks were found).
+    """
+    # Extract meeting_name and meeting_date from payload
+    meeting_name, meeting_date = _extract_meeting(payload)
+    
+    if meeting_name:
+        logger.info("Extracted meeting_name: %s", meeting_name)
+    else:
+        logger.warning("meeting_name not found in payload")
+    # Transform meeting_date to ISO 8601 format
+    if meeting_date:
+        formatted_date = format_date_to_iso8601(meeting_date)
+        if formatted_date:
+            meeting_date = formatted_date
+            logger.info("Extracted and formatted meeting_date: %s", meeting_date)
+        else:
+            logger.warning("Could not format meeting_date: %s", meeting_date)
+    else:
+        logger.warning("meeting_date not found in payload")
+    
+    # Parse tasks from payload
+    tasks = parse_tasks_from_payload(payload)
+    logger.info("Parsed %d task(s) from payload", len(tasks))
+    
+    if not tasks:
+        logger.info("No tasks found in payload")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Payload content: %s", _payload_repr.repr(payload))
+        return []
+    
+    # Prepare data for Zapier
+    zapier_datas = []
+    for task_data in tasks:
+        # Clean the task text
+        cleaned_task = clean_task_text(task_data['task'], task_data['owner'])
+        
+        zapier_data = {
+            'task': cleaned_task,
+            'owner': task_data['owner']
+        }
+        
+        # Add meeting_name and meeting_date if available
+        if meeting_name:
+            zapier_data['meeting_name'] = meeting_name
+        if meeting_date:
+            zapier_data['meeting_date'] = meeting_date
+        
+        zapier_datas.append(zapier_data)
+    
+    # Post all tasks to Zapier concurrently, so wall time is ~one round-trip rather than one per task
+    with ThreadPoolExecutor(max_workers=min(ZAPIER_MAX_WORKERS, len(zapier_datas))) as executor:
+        responses = list(executor.map(post_to_zapier, zapier_datas))
+    
+    results = []
+    rows = []
+    for idx, (zapier_data, (success, response_text)) in enumerate(zip(zapier_datas, responses), 1):
+        cleaned_task = zapier_data['task']
+        owner = zapier_data['owner']
+        
+        rows.append((payload_id, cleaned_task, owner, response_text, success, meeting_name, meeting_date))
+        results.append({
+            'task': cleaned_task,
+            'owner': owner,
+            'success': success,
+            'response': response_text
+        })
+        
+        if success:
+            logger.info("Successfully posted task %d to Zapier: %s... (Owner: %s)", idx, cleaned_task[:50], owner)
+        else:
+            logger.warning("Failed to post task %d to Zapier: %s", idx, response_text)
+    
+    # Save all tasks in one batch, without holding a connection during the Zapier calls.
+    # The pipeline sends the prepared inserts and the COMMIT in a single network flight.
+    try:
+        with get_db_connection() as conn:
+            with conn.pipeline():
+                with conn.cursor() as cursor:
+                    cursor.executemany("""
+                        INSERT INTO sent_tasks (payload_id, task, owner, zapier_response, success, meeting_name, meeting_date)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    """, rows)
+                
+                conn.commit()
+        logger.info("Committed %d task(s) to database", len(rows))
+    except Exception as db_error:
+        logger.exception("Error saving %d task(s) to database for payload_id=%s: %s", len(rows), payload_id, db_error)
+    
+    return results
+
+
+# Saved payloads waiting for task processing, drained by background workers so
+# webhook responses don't wait on Zapier
+TASK_WORKER_COUNT = 4
+
+_task_queue = queue.Queue()
+
+
+def _task_worker():
+    """Process queued (payload_id, payload) items forever"""
+    while True:
+        payload_id, payload = _task_queue.get()
+        try:
+            process_payload(payload_id, payload)
+        except Exception as e:
+            logger.exception("Error processing tasks for payload %s: %s", payload_id, e)
+        finally:
+            _task_queue.task_done()
+
+
+for i in range(TASK_WORKER_COUNT):
+    threading.Thread(target=_task_worker, name=f"task-worker-{i}", daemon=True).start()
+
+
+# Health check body for the common case, serialized once at import
+_HEALTH_OK_BODY = orjson.dumps({
+    "status": "ok",
+    "message": "Webhook receiver is running",
+    "database": "connected"
+})
+
+# A successful database probe is reused for this many seconds, so frequent
+# load balancer checks don't each run a pool check
+HEALTH_CACHE_SECONDS = 5
+_last_health_ok = {"at": float("-inf")}
+
+
 @app.route("/", methods=["GET"])
 def health_check():
     """Health check endpoint"""
+    if time.monotonic() - _last_health_ok["at"] < HEALTH_CACHE_SECONDS:
+        return Response(_HEALTH_OK_BODY, status=200, mimetype="application/json")
+    
     try:
-        # Test database connection
+        # Test database connection (drops broken pooled connections, then borrows one)
+        if POOL is not None:
+            POOL.check()
         with get_db_connection() as conn:
             pass
-        return jsonify({
-            "status": "ok",
-            "message": "Webhook receiver is running",
-            "database": "connected"
-        }), 200
+        _last_health_ok["at"] = time.monotonic()
+        return Response(_HEALTH_OK_BODY, status=200, mimetype="application/json")
     except Exception as e:
         return jsonify({
             "status": "ok",
@@ -293,304 +792,457 @@ def get_latest():
     """Get the most recent payload received"""
     try:
         with get_db_connection() as conn:
-            with conn.cursor(row_factory=dict_row) as cursor:
-                cursor.execute("""
-                    SELECT id, received_at, payload_data
+            # Payloads may arrive through other worker processes, so check the newest
+            # id (an index-only scan) and only load the body when the cache is behind
+            newest = conn.execute("""
+                SELECT id, received_at
+                FROM payloads
+                ORDER BY received_at DESC, id DESC
+                LIMIT 1
+            """).fetchone()
+            
+            if not newest:
+                return jsonify({"error": "No payloads found"}), 404
+            
+            with _latest_lock:
+                latest = dict(_latest)
+            
+            if latest["id"] != newest["id"]:
+                result = conn.execute("""
+                    SELECT id, received_at, payload_data, payload_blob
                     FROM payloads
-                    ORDER BY received_at DESC
-                    LIMIT 1
-                """)
+                    WHERE id = %s
+                """, (newest["id"],)).fetchone()
                 
-                result = cursor.fetchone()
-        
-        if not result:
-            return jsonify({"error": "No payloads found"}), 404
+                latest = {
+                    "id": result["id"],
+                    "received_at": result["received_at"],
+                    "payload": load_payload(result)
+                }
+                remember_latest(latest["id"], latest["received_at"], latest["payload"])
         
         return jsonify({
-            "id": result["id"],
-            "received_at": result["received_at"].isoformat(),
-            "payload": result["payload_data"]
+            "id": latest["id"],
+            "received_at": latest["received_at"],
+            "payload": latest["payload"]
         }), 200
         
     except Exception as e:
-        print(f"Error retrieving latest payload: {str(e)}")
+        logger.error("Error retrieving latest payload: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/payloads", methods=["GET"])
-def list_payloads():
-    """List all received payloads"""
-    try:
-        with get_db_connection() as conn:
-            with conn.cursor(row_factory=dict_row) as cursor:
+# Rows read per round-trip from the server-side cursors behind the listing endpoints
+STREAM_FETCH_SIZE = 100
+
+# Default and maximum page sizes for /payloads
+PAYLOADS_PAGE_SIZE = 100
+PAYLOADS_MAX_PAGE_SIZE = 200
+
+
+def _stream_json_chunks(head, chunks, tail):
+    """Yield a JSON response body: head, the comma-joined encoded row chunks, then tail"""
+    yield head
+    for index, chunk in enumerate(chunks):
+        yield chunk if index == 0 else b"," + chunk
+    yield tail
+
+
+def _fetch_payloads_page(before_id, limit):
+    """
+    Read one page of payload ids, keyset-paginated on id (newest first), from a
+    server-side cursor in STREAM_FETCH_SIZE batches. Each batch is encoded to JSON
+    as it arrives, so only the encoded page is buffered, and the pooled connection
+    is released before the response streams those chunks to a possibly slow client.
+    Returns (encoded chunks, row count, last id).
+    """
+    chunks = []
+    count = 0
+    last_id = None
+    with get_db_connection() as conn:
+        with conn.cursor(name="list_payloads", row_factory=dict_row) as cursor:
+            cursor.itersize = STREAM_FETCH_SIZE
+            if before_id is None:
+                cursor.execute("""
+                    SELECT id, received_at
+                    FROM payloads
+                    ORDER BY id DESC
+                    LIMIT %s
+                """, (limit,))
+            else:
                 cursor.execute("""
                     SELECT id, received_at
                     FROM payloads
-                    ORDER BY received_at DESC
-                """)
+                    WHERE id < %s
+                    ORDER BY id DESC
+                    LIMIT %s
+                """, (before_id, limit))
+            
+            while True:
+                rows = cursor.fetchmany(STREAM_FETCH_SIZE)
+                if not rows:
+                    break
                 
-                results = cursor.fetchall()
+                # Rows are already {"id", "received_at"} dicts, so the whole batch is
+                # encoded in one orjson call with the enclosing brackets dropped
+                chunks.append(orjson.dumps(rows)[1:-1])
+                count += len(rows)
+                last_id = rows[-1]["id"]
+    
+    return chunks, count, last_id
+
+
+@app.route("/payloads", methods=["GET"])
+def list_payloads():
+    """List received payloads, newest first (paginate with ?before_id=<next_cursor>&limit=<n>)"""
+    try:
+        before_id = request.args.get('before_id', default=None, type=int)
+        limit = min(max(request.args.get('limit', default=PAYLOADS_PAGE_SIZE, type=int), 1), PAYLOADS_MAX_PAGE_SIZE)
         
-        payloads = [
-            {
-                "id": row["id"],
-                "received_at": row["received_at"].isoformat()
-            }
-            for row in results
-        ]
+        chunks, count, last_id = _fetch_payloads_page(before_id, limit)
+        
+        # A full page means there may be more rows; pass next_cursor back as before_id
+        next_cursor = last_id if count == limit else None
+        tail = b'],' + orjson.dumps({"count": count, "limit": limit, "next_cursor": next_cursor})[1:]
+        
+        return Response(_stream_json_chunks(b'{"payloads":[', chunks, tail), status=200, mimetype="application/json")
+        
+    except Exception as e:
+        logger.error("Error listing payloads: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/summary", methods=["GET"])
+def get_summary():
+    """Get the latest payload and the most recent payload IDs in a single round-trip"""
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as latest_cursor, conn.cursor() as recent_cursor:
+                # Pipeline mode sends both queries before waiting for either result
+                with conn.pipeline():
+                    latest_cursor.execute("""
+                        SELECT id, received_at, payload_data, payload_blob
+                        FROM payloads
+                        ORDER BY received_at DESC, id DESC
+                        LIMIT 1
+                    """)
+                    recent_cursor.execute("""
+                        SELECT id, received_at
+                        FROM payloads
+                        ORDER BY received_at DESC, id DESC
+                        LIMIT 100
+                    """)
+                
+                latest = latest_cursor.fetchone()
+                recent = recent_cursor.fetchall()
         
         return jsonify({
-            "count": len(payloads),
-            "payloads": payloads
+            "latest": {
+                "id": latest["id"],
+                "received_at": latest["received_at"],
+                "payload": load_payload(latest)
+            } if latest else None,
+            "count": len(recent),
+            "payloads": [
+                {
+                    "id": row["id"],
+                    "received_at": row["received_at"]
+                }
+                for row in recent
+            ]
         }), 200
         
     except Exception as e:
-        print(f"Error listing payloads: {str(e)}")
+        logger.error("Error retrieving summary: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
+# Payload rows are never updated, so /payload/<id> lookups are cached with no expiry.
+# Only payloads stored in at most PAYLOAD_CACHE_MAX_BYTES are cached, so a handful
+# of long transcripts can't pin megabytes in every worker process
+PAYLOAD_CACHE_SIZE = 256
+PAYLOAD_CACHE_MAX_BYTES = 64 * 1024
+_payload_cache = OrderedDict()
+_payload_cache_lock = threading.Lock()
+
+
+def _fetch_payload(payload_id):
+    """
+    Fetch a payload row by ID, least-recently-used cached when small enough; a
+    missing ID raises LookupError so misses are not cached.
+    Returns (received_at, payload).
+    """
+    with _payload_cache_lock:
+        cached = _payload_cache.get(payload_id)
+        if cached is not None:
+            _payload_cache.move_to_end(payload_id)
+            return cached
+    
+    with get_db_connection() as conn:
+        with conn.cursor(row_factory=dict_row) as cursor:
+            cursor.execute("""
+                SELECT id, received_at, payload_data, payload_blob,
+                       COALESCE(octet_length(payload_blob), octet_length(payload_data::text)) AS size
+                FROM payloads
+                WHERE id = %s
+            """, (payload_id,))
+            
+            result = cursor.fetchone()
+    
+    if not result:
+        raise LookupError(payload_id)
+    
+    cached = (result["received_at"], load_payload(result))
+    if result["size"] <= PAYLOAD_CACHE_MAX_BYTES:
+        with _payload_cache_lock:
+            _payload_cache[payload_id] = cached
+            if len(_payload_cache) > PAYLOAD_CACHE_SIZE:
+                _payload_cache.popitem(last=False)
+    
+    return cached
+
+
 @app.route("/payload/<int:payload_id>", methods=["GET"])
 def get_payload(payload_id):
-    """Get a specific payload by ID"""
+    """Get a specific payload by ID (add ?pretty=1 for indented output)"""
     try:
-        with get_db_connection() as conn:
-            with conn.cursor(row_factory=dict_row) as cursor:
-                cursor.execute("""
-                    SELECT id, received_at, payload_data
-                    FROM payloads
-                    WHERE id = %s
-                """, (payload_id,))
-                
-                result = cursor.fetchone()
-        
-        if not result:
+        try:
+            received_at, payload = _fetch_payload(payload_id)
+        except LookupError:
             return jsonify({"error": "Payload not found"}), 404
         
-        return jsonify({
-            "id": result["id"],
-            "received_at": result["received_at"].isoformat(),
-            "payload": result["payload_data"]
-        }), 200
+        result = {
+            "id": payload_id,
+            "received_at": received_at,
+            "payload": payload
+        }
+        
+        # Payloads are stored compact; pretty-print on read only when asked to
+        if request.args.get('pretty', default=0, type=int):
+            return Response(orjson.dumps(result, option=orjson.OPT_INDENT_2), status=200, mimetype="application/json")
+        
+        return jsonify(result), 200
         
     except Exception as e:
-        print(f"Error retrieving payload: {str(e)}")
+        logger.error("Error retrieving payload: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
 @app.route("/webhook", methods=["POST"])
 def webhook():
-    """Endpoint to receive JSON payload from Zapier, parse tasks, and forward to Zapier"""
+    """Endpoint to receive JSON payload from Zapier; tasks are parsed and forwarded to Zapier in the background"""
     try:
-        # Get JSON payload from request
-        payload = request.get_json(force=True) if request.is_json else request.form.to_dict()
+        # Get JSON payload from request, parsing the raw body bytes directly; the
+        # same bytes are stored, so the payload is never re-serialized
+        body = None
+        if request.is_json:
+            body = request.get_data(cache=False)
+            try:
+                payload = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                return jsonify({"error": "Invalid JSON payload"}), 400
+        elif request.mimetype in ("application/x-www-form-urlencoded", "multipart/form-data"):
+            payload = request.form.to_dict()
+        else:
+            return jsonify({"error": "Unsupported content type, expected JSON or form data"}), 415
         
         if not payload:
             return jsonify({"error": "No payload received"}), 400
         
-        # Save to database
-        with get_db_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO payloads (payload_data)
-                    VALUES (%s)
-                    RETURNING id, received_at
-                """, (json.dumps(payload),))
-                
-                result = cursor.fetchone()
-                conn.commit()
+        # Save to database (batched with any concurrent requests)
+        payload_id, received_at = save_payload(payload, body)
         
-        payload_id, received_at = result
-        
-        print(f"Received payload and saved to database with ID {payload_id}")
-        print(f"Payload structure: {type(payload).__name__}")
-        if isinstance(payload, (list, dict)):
-            print(f"Payload keys/structure preview: {json.dumps(payload, indent=2)[:1000]}")
-        
-        # Extract meeting_name and meeting_date from payload
-        meeting_name = None
-        meeting_date = None
-        
-        # Handle list format - check all items in the list
-        if isinstance(payload, list):
-            for item in payload:
-                if isinstance(item, dict):
-                    # Check if this item has meeting_name or meeting_date
-                    if 'meeting_name' in item and meeting_name is None:
-                        meeting_name = item.get('meeting_name')
-                    if 'meeting_date' in item and meeting_date is None:
-                        meeting_date = item.get('meeting_date')
-                    # Also check nested structures
-                    if meeting_name is None or meeting_date is None:
-                        # Check if there are nested objects
-                        for key, value in item.items():
-                            if isinstance(value, dict):
-                                if 'meeting_name' in value and meeting_name is None:
-                                    meeting_name = value.get('meeting_name')
-                                if 'meeting_date' in value and meeting_date is None:
-                                    meeting_date = value.get('meeting_date')
-        # Handle dict format
-        elif isinstance(payload, dict):
-            meeting_name = payload.get('meeting_name')
-            meeting_date = payload.get('meeting_date')
-            # Also check nested structures
-            if meeting_name is None or meeting_date is None:
-                for key, value in payload.items():
-                    if isinstance(value, dict):
-                        if 'meeting_name' in value and meeting_name is None:
-                            meeting_name = value.get('meeting_name')
-                        if 'meeting_date' in value and meeting_date is None:
-                            meeting_date = value.get('meeting_date')
+        logger.info("Received payload and saved to database with ID %s", payload_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Payload structure: %s", type(payload).__name__)
+            logger.debug("Payload keys/structure preview: %s", _payload_repr.repr(payload))
         
-        if meeting_name:
-            print(f"Extracted meeting_name: {meeting_name}")
-        else:
-            print("WARNING: meeting_name not found in payload")
-        # Transform meeting_date to ISO 8601 format
-        if meeting_date:
-            formatted_date = format_date_to_iso8601(meeting_date)
-            if formatted_date:
-                meeting_date = formatted_date
-                print(f"Extracted and formatted meeting_date: {meeting_date}")
-            else:
-                print(f"Warning: Could not format meeting_date: {meeting_date}")
-        else:
-            print("WARNING: meeting_date not found in payload")
-        
-        # Parse tasks from payload
-        tasks = parse_tasks_from_payload(payload)
-        print(f"Parsed {len(tasks)} task(s) from payload")
-        
-        if not tasks:
-            print("No tasks found in payload")
-            print(f"Payload content: {json.dumps(payload, indent=2)[:500]}")  # Print first 500 chars for debugging
-            return jsonify({
-                "status": "success",
-                "message": "Payload received and saved, but no tasks found",
-                "id": payload_id,
-                "received_at": received_at.isoformat(),
-                "tasks_processed": 0
-            }), 200
-        
-        # Process and forward each task to Zapier
-        results = []
-        try:
-            with get_db_connection() as conn:
-                with conn.cursor() as cursor:
-                    for idx, task_data in enumerate(tasks, 1):
-                        # Clean the task text
-                        cleaned_task = clean_task_text(task_data['task'], task_data['owner'])
-                        
-                        # Prepare data for Zapier
-                        zapier_data = {
-                            'task': cleaned_task,
-                            'owner': task_data['owner']
-                        }
-                        
-                        # Add meeting_name and meeting_date if available
-                        if meeting_name:
-                            zapier_data['meeting_name'] = meeting_name
-                        if meeting_date:
-                            zapier_data['meeting_date'] = meeting_date
-                        
-                        # Post to Zapier
-                        success, response_text = post_to_zapier(zapier_data)
-                        
-                        # Save to database
-                        try:
-                            cursor.execute("""
-                                INSERT INTO sent_tasks (payload_id, task, owner, zapier_response, success, meeting_name, meeting_date)
-                                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                            """, (payload_id, cleaned_task, task_data['owner'], response_text, success, meeting_name, meeting_date))
-                            print(f"Task {idx}/{len(tasks)} saved to database: {cleaned_task[:50]}... (Owner: {task_data['owner']})")
-                        except Exception as db_error:
-                            print(f"ERROR saving task {idx} to database: {str(db_error)}")
-                            print(f"Task data: task={cleaned_task[:100]}, owner={task_data['owner']}, payload_id={payload_id}")
-                            # Continue processing other tasks even if one fails
-                        
-                        results.append({
-                            'task': cleaned_task,
-                            'owner': task_data['owner'],
-                            'success': success,
-                            'response': response_text
-                        })
-                        
-                        if success:
-                            print(f"Successfully posted task {idx} to Zapier: {cleaned_task[:50]}... (Owner: {task_data['owner']})")
-                        else:
-                            print(f"Failed to post task {idx} to Zapier: {response_text}")
-                    
-                    conn.commit()
-                    print(f"Committed {len(tasks)} task(s) to database")
-        except Exception as db_error:
-            print(f"ERROR in database transaction: {str(db_error)}")
-            import traceback
-            traceback.print_exc()
-        
-        successful_count = sum(1 for r in results if r['success'])
+        # Parse and forward tasks in the background so the caller isn't held up by Zapier
+        _task_queue.put((payload_id, payload))
         
         return jsonify({
-            "status": "success",
-            "message": f"Payload received and saved. Processed {len(tasks)} task(s), {successful_count} successfully posted to Zapier",
+            "status": "queued",
+            "message": "Payload received and saved. Tasks are being processed in the background",
             "id": payload_id,
-            "received_at": received_at.isoformat(),
-            "tasks_processed": len(tasks),
-            "tasks_successful": successful_count,
-            "results": results
-        }), 200
+            "received_at": received_at
+        }), 202
         
     except Exception as e:
-        print(f"Error processing webhook: {str(e)}")
+        logger.error("Error processing webhook: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/sent-tasks", methods=["GET"])
-def list_sent_tasks():
-    """List all tasks sent to Zapier"""
+# Largest number of payloads accepted in one /webhook/batch request
+WEBHOOK_BATCH_MAX_SIZE = 500
+
+
+@app.route("/webhook/batch", methods=["POST"])
+def webhook_batch():
+    """Endpoint to receive a JSON array of payloads, save them in one round-trip, and queue each for processing"""
     try:
-        limit = request.args.get('limit', default=50, type=int)
-        offset = request.args.get('offset', default=0, type=int)
+        try:
+            payloads = orjson.loads(request.get_data(cache=False))
+        except orjson.JSONDecodeError:
+            return jsonify({"error": "Invalid JSON payload"}), 400
+        
+        if not payloads or not isinstance(payloads, list):
+            return jsonify({"error": "Expected a non-empty JSON array of payloads"}), 400
         
+        if len(payloads) > WEBHOOK_BATCH_MAX_SIZE:
+            return jsonify({"error": f"Batch exceeds {WEBHOOK_BATCH_MAX_SIZE} payloads"}), 413
+        
+        # Reject the whole batch if any element would be rejected by /webhook
+        empty = [index for index, payload in enumerate(payloads) if not payload]
+        if empty:
+            return jsonify({"error": "No payload received", "indexes": empty}), 400
+        
+        # Save all payloads in one statement batch (executemany is pipelined by psycopg)
         with get_db_connection() as conn:
-            with conn.cursor(row_factory=dict_row) as cursor:
-                # Get total count
-                cursor.execute("SELECT COUNT(*) as total FROM sent_tasks")
-                total = cursor.fetchone()["total"]
+            with conn.cursor() as cursor:
+                cursor.executemany("""
+                    INSERT INTO payloads (payload_blob)
+                    VALUES (%s)
+                    RETURNING id, received_at
+                """, [(orjson.dumps(payload),) for payload in payloads], returning=True)
                 
-                # Get tasks
+                saved = []
+                while True:
+                    saved.append(cursor.fetchone())
+                    if not cursor.nextset():
+                        break
+            
+            conn.commit()
+        
+        logger.info("Received batch of %d payload(s), saved with IDs %s", len(payloads), [row['id'] for row in saved])
+        
+        batch_results = []
+        for row, payload in zip(saved, payloads):
+            remember_latest(row["id"], row["received_at"], payload)
+            _task_queue.put((row["id"], payload))
+            batch_results.append({
+                "id": row["id"],
+                "received_at": row["received_at"]
+            })
+        
+        return jsonify({
+            "status": "queued",
+            "message": f"Batch received and saved. Queued {len(payloads)} payload(s) for processing",
+            "count": len(batch_results),
+            "payloads": batch_results
+        }), 202
+        
+    except Exception as e:
+        logger.error("Error processing webhook batch: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+
+# Default and maximum page sizes for /sent-tasks; pages are buffered (encoded) while
+# the connection is held, so the cap also bounds that buffer
+SENT_TASKS_PAGE_SIZE = 50
+SENT_TASKS_MAX_PAGE_SIZE = 200
+
+
+def _fetch_sent_tasks_page(limit, offset, before):
+    """
+    Read one page of sent tasks, newest first, from a server-side cursor in the same
+    way as _fetch_payloads_page. Pages are keyset-paginated on (sent_at, id) when
+    before is given (total is then None), otherwise offset-paginated.
+    Returns (encoded chunks, row count, total, last row).
+    """
+    chunks = []
+    count = 0
+    total = None
+    last_row = None
+    with get_db_connection() as conn:
+        with conn.cursor(name="list_sent_tasks", row_factory=tuple_row) as cursor:
+            cursor.itersize = STREAM_FETCH_SIZE
+            if before is None:
+                # The total count rides along on every row, saving a separate COUNT query
                 cursor.execute("""
-                    SELECT id, payload_id, task, owner, sent_at, zapier_response, success, meeting_name, meeting_date
+                    SELECT id, payload_id, task, owner, sent_at, zapier_response, success, meeting_name, meeting_date,
+                           COUNT(*) OVER () AS total
                     FROM sent_tasks
-                    ORDER BY sent_at DESC
+                    ORDER BY sent_at DESC, id DESC
                     LIMIT %s OFFSET %s
                 """, (limit, offset))
+            else:
+                # Keyset pages seek straight to the cursor, so they skip the total,
+                # which would need a scan of every remaining row
+                cursor.execute("""
+                    SELECT id, payload_id, task, owner, sent_at, zapier_response, success, meeting_name, meeting_date,
+                           NULL::bigint AS total
+                    FROM sent_tasks
+                    WHERE (sent_at, id) < (%s, %s)
+                    ORDER BY sent_at DESC, id DESC
+                    LIMIT %s
+                """, (*before, limit))
+            
+            while True:
+                rows = cursor.fetchmany(STREAM_FETCH_SIZE)
+                if not rows:
+                    break
                 
-                results = cursor.fetchall()
+                if total is None:
+                    total = rows[0][-1]
+                last_row = rows[-1]
+                
+                chunks.append(b",".join(
+                    orjson.dumps({
+                        "id": task_id,
+                        "payload_id": payload_id,
+                        "task": task,
+                        "owner": owner,
+                        "sent_at": sent_at,
+                        "success": success,
+                        "zapier_response": zapier_response,
+                        "meeting_name": meeting_name,
+                        "meeting_date": meeting_date
+                    })
+                    for task_id, payload_id, task, owner, sent_at, zapier_response, success, meeting_name, meeting_date, _ in rows
+                ))
+                count += len(rows)
         
-        tasks = [
-            {
-                "id": row["id"],
-                "payload_id": row["payload_id"],
-                "task": row["task"],
-                "owner": row["owner"],
-                "sent_at": row["sent_at"].isoformat(),
-                "success": row["success"],
-                "zapier_response": row["zapier_response"],
-                "meeting_name": row.get("meeting_name"),
-                "meeting_date": row.get("meeting_date")
-            }
-            for row in results
-        ]
+        # An empty page (e.g. offset past the end) carries no rows to read the total from
+        if total is None and before is None:
+            total = conn.execute("SELECT COUNT(*) as total FROM sent_tasks").fetchone()["total"]
+    
+    return chunks, count, total, last_row
+
+
+def _parse_sent_tasks_cursor(value):
+    """Parse a /sent-tasks "<sent_at iso>,<id>" cursor into (datetime, int), raising ValueError if malformed"""
+    sent_at, _, task_id = value.rpartition(",")
+    return datetime.fromisoformat(sent_at), int(task_id)
+
+
+@app.route("/sent-tasks", methods=["GET"])
+def list_sent_tasks():
+    """List tasks sent to Zapier, newest first (paginate with ?before=<next_cursor>&limit=<n>, or ?offset=<n>)"""
+    try:
+        limit = min(max(request.args.get('limit', default=SENT_TASKS_PAGE_SIZE, type=int), 1), SENT_TASKS_MAX_PAGE_SIZE)
+        offset = max(request.args.get('offset', default=0, type=int), 0)
+        before = request.args.get('before')
+        if before is not None:
+            try:
+                before = _parse_sent_tasks_cursor(before)
+            except ValueError:
+                return jsonify({"error": "Invalid before cursor"}), 400
         
-        return jsonify({
-            "count": len(tasks),
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-            "tasks": tasks
-        }), 200
+        chunks, count, total, last_row = _fetch_sent_tasks_page(limit, offset, before)
+        
+        # A full page means there may be more rows; pass next_cursor back as before
+        next_cursor = f"{last_row[4].isoformat()},{last_row[0]}" if count == limit else None
+        trailer = {"count": count, "total": total, "limit": limit}
+        if before is None:
+            # Keyset pages ignore offset, so it is only reported for offset pages
+            trailer["offset"] = offset
+        trailer["next_cursor"] = next_cursor
+        tail = b'],' + orjson.dumps(trailer)[1:]
+        
+        return Response(_stream_json_chunks(b'{"tasks":[', chunks, tail), status=200, mimetype="application/json")
         
     except Exception as e:
-        print(f"Error listing sent tasks: {str(e)}")
+        logger.error("Error listing sent tasks: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
@@ -600,8 +1252,9 @@ def get_sent_task(task_id):
     try:
         with get_db_connection() as conn:
             with conn.cursor(row_factory=dict_row) as cursor:
+                # Columns are in response order so the row can be returned as-is
                 cursor.execute("""
-                    SELECT id, payload_id, task, owner, sent_at, zapier_response, success, meeting_name, meeting_date
+                    SELECT id, payload_id, task, owner, sent_at, success, zapier_response, meeting_name, meeting_date
                     FROM sent_tasks
                     WHERE id = %s
                 """, (task_id,))
@@ -611,63 +1264,54 @@ def get_sent_task(task_id):
         if not result:
             return jsonify({"error": "Task not found"}), 404
         
-        return jsonify({
-            "id": result["id"],
-            "payload_id": result["payload_id"],
-            "task": result["task"],
-            "owner": result["owner"],
-            "sent_at": result["sent_at"].isoformat(),
-            "success": result["success"],
-            "zapier_response": result["zapier_response"],
-            "meeting_name": result.get("meeting_name"),
-            "meeting_date": result.get("meeting_date")
-        }), 200
+        return jsonify(result), 200
         
     except Exception as e:
-        print(f"Error retrieving sent task: {str(e)}")
+        logger.error("Error retrieving sent task: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
+# Default and maximum number of tasks returned by /payload/<id>/tasks
+PAYLOAD_TASKS_PAGE_SIZE = 100
+PAYLOAD_TASKS_MAX_PAGE_SIZE = 500
+
+
 @app.route("/payload/<int:payload_id>/tasks", methods=["GET"])
 def get_payload_tasks(payload_id):
-    """Get all tasks sent to Zapier for a specific payload"""
+    """Get the most recent tasks sent to Zapier for a specific payload"""
     try:
+        limit = min(max(request.args.get('limit', default=PAYLOAD_TASKS_PAGE_SIZE, type=int), 1), PAYLOAD_TASKS_MAX_PAGE_SIZE)
+        
         with get_db_connection() as conn:
             with conn.cursor(row_factory=dict_row) as cursor:
+                # Columns are in response order so rows can be returned as-is
                 cursor.execute("""
-                    SELECT id, task, owner, sent_at, zapier_response, success, meeting_name, meeting_date
+                    SELECT id, task, owner, sent_at, success, zapier_response, meeting_name, meeting_date
                     FROM sent_tasks
                     WHERE payload_id = %s
-                    ORDER BY sent_at DESC
-                """, (payload_id,))
+                    ORDER BY sent_at DESC, id DESC
+                    LIMIT %s
+                """, (payload_id, limit))
                 
-                results = cursor.fetchall()
-        
-        tasks = [
-            {
-                "id": row["id"],
-                "task": row["task"],
-                "owner": row["owner"],
-                "sent_at": row["sent_at"].isoformat(),
-                "success": row["success"],
-                "zapier_response": row["zapier_response"],
-                "meeting_name": row.get("meeting_name"),
-                "meeting_date": row.get("meeting_date")
-            }
-            for row in results
-        ]
+                tasks = cursor.fetchall()
         
         return jsonify({
             "payload_id": payload_id,
             "count": len(tasks),
+            "limit": limit,
             "tasks": tasks
         }), 200
         
     except Exception as e:
-        print(f"Error retrieving payload tasks: {str(e)}")
+        logger.error("Error retrieving payload tasks: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
 if __name__ == "__main__":
+    try:
+        init_db()
+    except Exception as e:
+        # Local development server: keep running, the database may come up later
+        logger.error("Error initializing database: %s", e)
     port = int(os.environ.get("PORT", 5000))
     app.run(host="0.0.0.0", port=port, debug=False)
@@ -0,0 +1,18 @@
+import queue
+
+import pytest
+
+import app as app_module
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def task_queue(monkeypatch):
+    # Swap in a fresh queue so nothing a test enqueues reaches the background workers
+    task_queue = queue.Queue()
+    monkeypatch.setattr(app_module, "_task_queue", task_queue)
+    return task_queue
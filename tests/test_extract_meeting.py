@@ -0,0 +1,38 @@
+from app import _extract_meeting
+
+
+def test_top_level_fields():
+    payload = {"meeting_name": "Weekly sync", "meeting_date": "2026-01-05", "krisp_blob": "..."}
+    assert _extract_meeting(payload) == ("Weekly sync", "2026-01-05")
+
+
+def test_name_and_date_in_different_nested_dicts():
+    payload = {
+        "data": {"meeting": {"meeting_name": "Planning"}},
+        "meta": {"details": {"meeting_date": "2026-02-10T09:00:00Z"}},
+    }
+    assert _extract_meeting(payload) == ("Planning", "2026-02-10T09:00:00Z")
+
+
+def test_missing_meeting_fields():
+    assert _extract_meeting({"text": "Task: a Owner: B", "data": {"other": 1}}) == (None, None)
+    assert _extract_meeting({"meeting_name": "Retro"}) == ("Retro", None)
+    assert _extract_meeting("plain text") == (None, None)
+
+
+def test_lists_at_depth():
+    payload = [
+        {"krisp_blob": "..."},
+        {"events": [[{"meeting_date": "2026-03-01"}], {"meeting": {"meeting_name": "Launch"}}]},
+    ]
+    assert _extract_meeting(payload) == ("Launch", "2026-03-01")
+
+
+def test_first_occurrence_in_document_order_wins():
+    payload = {
+        "items": [{"meeting_name": "First", "meeting_date": "2026-04-01"}],
+        "meeting_name": "Top level",
+        "later": {"meeting_name": "Second", "meeting_date": "2026-04-02"},
+    }
+    # A dict's own keys are read before its children are walked
+    assert _extract_meeting(payload) == ("Top level", "2026-04-01")
@@ -0,0 +1,40 @@
+import time
+
+from app import TASK_MATCH_WINDOW, _parse_tasks_from_text
+
+
+def test_owner_name_is_not_cut_at_window_edge():
+    # "Owner:" starts inside the window for every length here, so the full name must come back
+    for length in range(TASK_MATCH_WINDOW - 30, TASK_MATCH_WINDOW - 7):
+        text = "Task: " + "x" * length + " Owner: Anthony"
+        assert _parse_tasks_from_text(text) == [{"task": "x" * length, "owner": "Anthony"}], length
+
+
+def test_owner_past_window_is_not_matched():
+    text = "Task: " + "x" * TASK_MATCH_WINDOW + " Owner: Anthony"
+    assert _parse_tasks_from_text(text) == []
+
+
+def test_tasks_after_an_overlong_task_are_still_found():
+    text = "Task: " + "x" * TASK_MATCH_WINDOW + " Task: Send the deck Owner: David"
+    assert _parse_tasks_from_text(text) == [{"task": "Send the deck", "owner": "David"}]
+
+
+def _repeat_to(unit, size):
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def test_whitespace_runs_do_not_backtrack_quadratically():
+    for unit in ("Task:a" + " " * 100 + "xOwner:", "Task: a" + " \t" * 1000 + "xOwner: "):
+        text = _repeat_to(unit, 200_000)
+        started = time.perf_counter()
+        assert _parse_tasks_from_text(text) == []
+        assert time.perf_counter() - started < 1.5
+
+
+def test_single_character_task_stops_at_first_owner():
+    text = "Task: a Owner: B Task: c d Owner: E"
+    assert _parse_tasks_from_text(text) == [
+        {"task": "a", "owner": "B"},
+        {"task": "c d", "owner": "E"},
+    ]
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import pytest
+
+import app as app_module
+from app import _parse_sent_tasks_cursor
+
+
+def test_cursor_round_trip():
+    sent_at = datetime(2026, 3, 14, 9, 26, 53, 589793)
+    assert _parse_sent_tasks_cursor(f"{sent_at.isoformat()},42") == (sent_at, 42)
+
+
+@pytest.mark.parametrize("value", [
+    "2026-03-14T09:26:53",
+    "2026-03-14T09:26:53,abc",
+    "2026-03-14T09:26:53,",
+    "not-a-date,42",
+    ",42",
+])
+def test_malformed_cursor_raises_value_error(value):
+    with pytest.raises(ValueError):
+        _parse_sent_tasks_cursor(value)
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    """Replace the page query, recording the arguments of each call"""
+    calls = []
+    last_row = (7, 3, "Send the deck", "David", datetime(2026, 3, 14, 9, 26, 53, 589793))
+
+    def fetch_sent_tasks_page(limit, offset, before):
+        calls.append((limit, offset, before))
+        return [b'{"id":7}'], limit, None, last_row
+
+    monkeypatch.setattr(app_module, "_fetch_sent_tasks_page", fetch_sent_tasks_page)
+    return calls
+
+
+def test_next_cursor_is_accepted_as_before(client, pages):
+    first = client.get("/sent-tasks?limit=1").get_json()
+    assert first["next_cursor"] == "2026-03-14T09:26:53.589793,7"
+    assert first["offset"] == 0
+    second = client.get("/sent-tasks", query_string={"limit": 1, "before": first["next_cursor"]}).get_json()
+    assert pages[1] == (1, 0, (datetime(2026, 3, 14, 9, 26, 53, 589793), 7))
+    assert "offset" not in second
+
+
+@pytest.mark.parametrize("before", ["2026-03-14T09:26:53", "2026-03-14T09:26:53,abc", "yesterday,7"])
+def test_invalid_before_is_a_bad_request(client, pages, before):
+    response = client.get("/sent-tasks", query_string={"before": before})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Invalid before cursor"}
+    assert pages == []
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+import pytest
+
+import app as app_module
+
+
+@pytest.fixture
+def saved(monkeypatch):
+    """Replace save_payload, recording what would have been written"""
+    saved = []
+
+    def save_payload(payload, body=None):
+        saved.append((payload, body))
+        return len(saved), datetime(2026, 1, 1, 12, 0)
+
+    monkeypatch.setattr(app_module, "save_payload", save_payload)
+    return saved
+
+
+def test_json_body_is_parsed_and_stored_as_sent(client, saved, task_queue):
+    body = b'{"krisp_blob": "Task: Send the deck Owner: David"}'
+    response = client.post("/webhook", data=body, content_type="application/json")
+    assert response.status_code == 202
+    assert response.get_json()["id"] == 1
+    assert saved == [({"krisp_blob": "Task: Send the deck Owner: David"}, body)]
+    assert task_queue.get_nowait() == (1, {"krisp_blob": "Task: Send the deck Owner: David"})
+
+
+def test_form_body_is_accepted(client, saved, task_queue):
+    response = client.post("/webhook", data={"krisp_blob": "Task: a Owner: B"})
+    assert response.status_code == 202
+    assert saved == [({"krisp_blob": "Task: a Owner: B"}, None)]
+
+
+def test_unsupported_content_type(client, saved, task_queue):
+    response = client.post("/webhook", data="Task: a Owner: B", content_type="text/plain")
+    assert response.status_code == 415
+    assert saved == []
+    assert task_queue.empty()
+
+
+@pytest.mark.parametrize("body", [b'{"a": NaN}', b'{"a": Infinity}', b'{"a": -Infinity}', b'{"a": ', b''])
+def test_invalid_json_is_a_bad_request(client, saved, task_queue, body):
+    response = client.post("/webhook", data=body, content_type="application/json")
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Invalid JSON payload"}
+    assert saved == []
+
+
+def test_integers_beyond_64_bits_are_decoded_as_floats(client, saved, task_queue):
+    body = b'{"big": 18446744073709551616}'
+    response = client.post("/webhook", data=body, content_type="application/json")
+    assert response.status_code == 202
+    # The parsed payload loses precision, but the stored body is the original bytes
+    assert saved == [({"big": 1.8446744073709552e19}, body)]
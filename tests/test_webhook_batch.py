@@ -0,0 +1,87 @@
+from contextlib import contextmanager
+from datetime import datetime
+
+import orjson
+import pytest
+
+import app as app_module
+from app import WEBHOOK_BATCH_MAX_SIZE
+
+
+class FakeCursor:
+    """Stands in for the psycopg cursor: one RETURNING row per executemany parameter set"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def executemany(self, query, params_seq, returning=False):
+        for params in params_seq:
+            self.conn.next_id += 1
+            self.conn.inserted.append(orjson.loads(params[0]))
+            self.rows.append({"id": self.conn.next_id, "received_at": datetime(2026, 1, 1, 12, 0)})
+
+    def fetchone(self):
+        return self.rows[0]
+
+    def nextset(self):
+        self.rows.pop(0)
+        return bool(self.rows)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.next_id = 40
+        self.inserted = []
+        self.committed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    conn = FakeConnection()
+
+    @contextmanager
+    def get_db_connection():
+        yield conn
+
+    monkeypatch.setattr(app_module, "get_db_connection", get_db_connection)
+    return conn
+
+
+def test_oversized_batch_is_rejected(client, conn, task_queue):
+    response = client.post("/webhook/batch", json=[{"n": n} for n in range(WEBHOOK_BATCH_MAX_SIZE + 1)])
+    assert response.status_code == 413
+    assert conn.inserted == []
+    assert task_queue.empty()
+
+
+def test_empty_elements_are_reported_by_index(client, conn, task_queue):
+    response = client.post("/webhook/batch", json=[{}, {"text": "Task: a Owner: B"}])
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "No payload received", "indexes": [0]}
+    assert conn.inserted == []
+    assert task_queue.empty()
+
+
+def test_batch_is_saved_and_queued_in_order(client, conn, task_queue):
+    payloads = [{"text": "first"}, {"text": "second"}, {"text": "third"}]
+    response = client.post("/webhook/batch", json=payloads)
+    assert response.status_code == 202
+    body = response.get_json()
+    assert body["count"] == 3
+    assert [item["id"] for item in body["payloads"]] == [41, 42, 43]
+    assert conn.inserted == payloads
+    assert conn.committed
+    assert [task_queue.get_nowait() for _ in payloads] == list(zip([41, 42, 43], payloads))